@@ -1,24 +1,39 @@
 from dataclasses import dataclass
-import dataclasses
-from enum import IntEnum
-from typing import Any, cast, ClassVar, Dict, Generator, List, Optional, Set
+import sys
+from typing import Any, cast, ClassVar, Dict, FrozenSet, List, Optional
 
 from BaseClasses import Item, ItemClassification
 
 
-class SekiroItemCategory(IntEnum):
+class SekiroItemCategory:
+    """Plain int constants for item categories.
+
+    These are bare ints rather than an IntEnum so that categories are exact ints, which keeps dict
+    and set lookups on them slightly cheaper and their repr plain. Nothing here needs the Enum API.
+    """
     MISC = 0
     UNIQUE = 1
     UPGRADE = 2
 
-@dataclass
+CATEGORY_GROUP = {
+    SekiroItemCategory.MISC: "Miscellaneous",
+    SekiroItemCategory.UNIQUE: "Unique",
+    SekiroItemCategory.UPGRADE: "Upgrade",
+}
+"""The name of the item group that holds each item category."""
+
+_NON_UNIQUE_CATEGORIES = frozenset({SekiroItemCategory.MISC, SekiroItemCategory.UPGRADE})
+"""Item categories that may appear more than once in the randomizer."""
+
+@dataclass(slots=True)
 class SekiroItemData:
     __item_id: ClassVar[int] = 100000
     """The next item ID to use when creating item data."""
 
     name: str
     sekiro_code: Optional[int]
-    category: SekiroItemCategory
+    category: int
+    """One of the SekiroItemCategory constants."""
 
     base_name: Optional[str] = None
     """The name of the individual item, if this is a multi-item group."""
@@ -50,11 +65,10 @@ class SekiroItemData:
     @property
     def unique(self):
         """Whether this item should be unique, appearing only once in the randomizer."""
-        return self.category not in {
-            SekiroItemCategory.MISC, SekiroItemCategory.UPGRADE,
-        }
+        return self.category not in _NON_UNIQUE_CATEGORIES
 
     def __post_init__(self):
+        self.name = sys.intern(self.name)
         self.ap_code = self.ap_code or SekiroItemData.__item_id
         if not self.base_name: self.base_name = self.name
         SekiroItemData.__item_id += 1
@@ -63,29 +77,29 @@ class SekiroItemData:
         """The names of item groups this item should appear in.
 
         This is computed from the properties assigned to this item."""
-        names = []
-        if self.classification == ItemClassification.progression: names.append("Progression")
-
-        names.append({
-            SekiroItemCategory.MISC: "Miscellaneous",
-            SekiroItemCategory.UNIQUE: "Unique",
-            SekiroItemCategory.UPGRADE: "Upgrade",
-        }[self.category])
-
+        names = ["Progression"] if self.classification == ItemClassification.progression else []
+        names.append(CATEGORY_GROUP[self.category])
         return names
 
-    def counts(self, counts: List[int]) -> Generator["SekiroItemData", None, None]:
-        """Returns an iterable of copies of this item with the given counts."""
-        yield self
-        for count in counts:
-            yield dataclasses.replace(
-                self,
-                ap_code = None,
+    def counts(self, counts: List[int]) -> List["SekiroItemData"]:
+        """Returns a list of this item followed by copies of it with the given counts."""
+        return [self] + [
+            SekiroItemData(
                 name = "{} x{}".format(self.base_name, count),
+                sekiro_code = self.sekiro_code,
+                category = self.category,
                 base_name = self.base_name,
+                classification = self.classification,
+                ap_code = None,
+                is_dlc = self.is_dlc,
                 count = count,
+                inject = self.inject,
+                souls = self.souls,
                 filler = False, # Don't count multiples as filler by default
+                skip = self.skip,
             )
+            for count in counts
+        ]
 
 
 class SekiroItem(Item):
@@ -102,12 +116,19 @@ class SekiroItem(Item):
 
     @staticmethod
     def event(name: str, player: int) -> "SekiroItem":
-        data = SekiroItemData(name, None, SekiroItemCategory.MISC,
-                           skip = True, classification = ItemClassification.progression)
-        data.ap_code = None
+        data = _event_data_cache.get(name)
+        if data is None:
+            data = SekiroItemData(name, None, SekiroItemCategory.MISC,
+                               skip = True, classification = ItemClassification.progression)
+            data.ap_code = None
+            _event_data_cache[name] = data
         return SekiroItem(player, data)
 
 
+_event_data_cache: Dict[str, SekiroItemData] = {}
+"""Item data for event items, shared between every player that creates the same event."""
+
+
 _vanilla_items = [
     # TODO: Actually give real item codes, just threw in random numbers as placeholders
 
@@ -136,11 +157,12 @@ _vanilla_items = [
     SekiroItemData("Gachiin's Sugar", 0x00555436, SekiroItemCategory.MISC, filler = True),
 ]
 
-item_name_groups: Dict[str, Set] = {
-    "Progression": set(),
-    "Miscellaneous": set(),
-    "Unique": set(),
-    "Upgrade": set(),
+# These are built up as lists and frozen into item_name_groups once they're complete.
+_item_groups: Dict[str, List[str]] = {
+    "Progression": [],
+    "Miscellaneous": [],
+    "Unique": [],
+    "Upgrade": [],
 }
 
 
@@ -155,7 +177,24 @@ item_descriptions = {
 
 for item_data in _vanilla_items:
     for group_name in item_data.item_groups():
-        item_name_groups[group_name].add(item_data.name)
+        _item_groups[group_name].append(item_data.name)
+
+item_name_groups: Dict[str, FrozenSet[str]] = {
+    group_name: frozenset(names) for group_name, names in _item_groups.items()
+}
 
 filler_item_names = [item_data.name for item_data in _vanilla_items if item_data.filler]
 item_dictionary = {item_data.name: item_data for item_data in _vanilla_items}
+item_name_to_id = {data.name: data.ap_code for data in item_dictionary.values() if data.ap_code is not None}
+
+injectable_mandatory_items = [
+    item for item in item_dictionary.values()
+    if item.inject and item.classification == ItemClassification.progression
+]
+"""Injectable items that must end up somewhere for the game to be completable."""
+
+injectable_optional_items = [
+    item for item in item_dictionary.values()
+    if item.inject and item.classification != ItemClassification.progression
+]
+"""Injectable items that are only added if there's room."""
@@ -1,8 +1,10 @@
-from typing import cast, ClassVar, Optional, Dict, List, Set
-from dataclasses import dataclass
+from typing import ClassVar, FrozenSet, Optional, Dict, List
+from dataclasses import dataclass, field
+from itertools import chain
+import sys
 
 from BaseClasses import ItemClassification, Location, Region
-from .Items import SekiroItemCategory, item_dictionary
+from .Items import CATEGORY_GROUP, SekiroItemData, item_dictionary
 
 # Regions in approximate order of reward, mostly measured by how high-quality the upgrade items are
 # in each region.
@@ -11,7 +13,7 @@ region_order = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class SekiroLocationData:
     __location_id: ClassVar[int] = 100000
     """The next location ID to use when creating location data."""
@@ -93,7 +95,7 @@ class SekiroLocationData:
     drop: bool = False
     """Whether this is an item dropped by a (non-boss) enemy.
 
-    This is automatically set to True if miniboss, mimic, lizard, or hostile_npc is True.
+    This is automatically set to True if miniboss is True.
     """
 
     shop: bool = False
@@ -116,35 +118,48 @@ class SekiroLocationData:
     This is for players without an encyclopedic knowledge of Sekiro.
     """
 
-    @property
-    def is_event(self) -> bool:
-        """Whether this location represents an event rather than a specific item pickup."""
-        return self.default_item_name is None
+    is_event: bool = field(init=False, repr=False, compare=False)
+    """Whether this location represents an event rather than a specific item pickup.
+
+    This is derived from default_item_name when the location is created.
+    """
+
+    _default_item: Optional[SekiroItemData] = field(default=None, init=False, repr=False, compare=False)
+    """The item data for default_item_name, or None if this is an event."""
 
     def __post_init__(self):
+        # Interned names let lookups in item_dictionary and the name groups hit the identity fast
+        # path.
+        self.name = sys.intern(self.name)
+        if self.default_item_name is not None:
+            self.default_item_name = sys.intern(self.default_item_name)
+
+        self.is_event = self.default_item_name is None
         if not self.is_event:
             self.ap_code = self.ap_code or SekiroLocationData.__location_id
             SekiroLocationData.__location_id += 1
+            self._default_item = item_dictionary[self.default_item_name]
         if self.miniboss: self.drop = True
 
     def location_groups(self) -> List[str]:
         """The names of location groups this location should appear in.
 
         This is computed from the properties assigned to this location."""
-        names = []
-        if self.prominent: names.append("Prominent")
-        if self.progression: names.append("Progression")
-        if self.boss: names.append("Boss Rewards")
-        if self.miniboss: names.append("Miniboss Rewards")
-        if self.npc: names.append("Friendly NPC Rewards")
-        if self.hidden: names.append("Hidden")
-
-        default_item = item_dictionary[cast(str, self.default_item_name)]
-        names.append({
-                         SekiroItemCategory.MISC: "Miscellaneous",
-                         SekiroItemCategory.UNIQUE: "Unique",
-                         SekiroItemCategory.UPGRADE: "Upgrade",
-                     }[default_item.category])
+        names = [
+            name for flag, name in (
+                (self.prominent, "Prominent"),
+                (self.progression, "Progression"),
+                (self.boss, "Boss Rewards"),
+                (self.miniboss, "Miniboss Rewards"),
+                (self.npc, "Friendly NPC Rewards"),
+                (self.hidden, "Hidden"),
+            )
+            if flag
+        ]
+
+        # This is only called for non-event locations, which always have a default item.
+        default_item = self._default_item
+        names.append(CATEGORY_GROUP[default_item.category])
         if default_item.classification == ItemClassification.progression:
             names.append("Progression")
 
@@ -254,17 +269,21 @@ location_tables: Dict[str, List[SekiroLocationData]] = {
               ]
 }
 
-for i, region in enumerate(region_order):
-    for location in location_tables[region]: location.region_value = i
+region_index = {region: i for i, region in enumerate(region_order)}
+for region, location_table in location_tables.items():
+    region_value = region_index.get(region)
+    if region_value is None: continue
+    for location in location_table: location.region_value = region_value
 
-location_name_groups: Dict[str, Set[str]] = {
+# These are built up as lists and frozen into location_name_groups once they're complete.
+_location_groups: Dict[str, List[str]] = {
     # We could insert these locations automatically with setdefault(), but we set them up explicitly
     # instead so we can choose the ordering.
-    "Prominent": set(),
-    "Progression": set(),
-    "Boss Rewards": set(),
-    "Unique": set(),
-    "Miscellaneous": set(),
+    "Prominent": [],
+    "Progression": [],
+    "Boss Rewards": [],
+    "Unique": [],
+    "Miscellaneous": [],
 }
 
 location_descriptions = {
@@ -278,16 +297,25 @@ location_descriptions = {
 
 location_dictionary: Dict[str, SekiroLocationData] = {}
 for location_name, location_table in location_tables.items():
-    location_dictionary.update({location_data.name: location_data for location_data in location_table})
-
+    region_group: List[str] = []
     for location_data in location_table:
-        if not location_data.is_event:
-            for group_name in location_data.location_groups():
-                location_name_groups[group_name].add(location_data.name)
+        location_dictionary[location_data.name] = location_data
+        if location_data.is_event: continue
+
+        region_group.append(location_data.name)
+        for group_name in location_data.location_groups():
+            _location_groups[group_name].append(location_data.name)
 
     # Allow entire locations to be added to location sets.
     if not location_name.endswith(" Shop"):
-        location_name_groups[location_name] = set([
-            location_data.name for location_data in location_table
-            if not location_data.is_event
-        ])
+        _location_groups[location_name] = region_group
+
+location_name_groups: Dict[str, FrozenSet[str]] = {
+    group_name: frozenset(names) for group_name, names in _location_groups.items()
+}
+
+location_name_to_id = {
+    location.name: location.ap_code
+    for location in chain.from_iterable(location_tables.values())
+    if location.ap_code is not None
+}
@@ -57,6 +57,8 @@ class RandomEnemyPresetOption(OptionDict):
 
     @classmethod
     def get_option_name(cls, value: Dict[str, Any]) -> str:
+        # The default empty preset is by far the most common value.
+        if not value: return "{}"
         return json.dumps(value)
 
 
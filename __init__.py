@@ -1,20 +1,74 @@
 # world/dark_souls_3/__init__.py
 from collections.abc import Sequence
-from collections import defaultdict
+from collections import Counter, defaultdict
+import functools
 import json
 from logging import warning
-from typing import cast, Any, Callable, Dict, Set, List, Optional, TextIO, Union
+from typing import cast, Any, Callable, Dict, Set, List, Optional, TextIO, Tuple, Union
 
-from BaseClasses import CollectionState, MultiWorld, Region, Location, LocationProgressType, Entrance, Tutorial, ItemClassification
+from BaseClasses import CollectionState, Item, MultiWorld, Region, Location, LocationProgressType, Entrance, Tutorial, ItemClassification
 
 from worlds.AutoWorld import World, WebWorld
 from worlds.generic.Rules import CollectionRule, ItemRule, add_rule, add_item_rule
 
-from .Items import SekiroItem, SekiroItemData, filler_item_names, item_descriptions, item_dictionary, item_name_groups
-from .Locations import SekiroLocation, SekiroLocationData, location_tables, location_descriptions, location_dictionary, location_name_groups, region_order
+from .Items import SekiroItem, SekiroItemData, filler_item_names, injectable_mandatory_items, injectable_optional_items, item_descriptions, item_dictionary, item_name_groups, item_name_to_id
+from .Locations import SekiroLocation, SekiroLocationData, location_tables, location_descriptions, location_dictionary, location_name_groups, location_name_to_id, region_order
 from .Options import SekiroOptions, option_groups
 
 
+_REGION_EDGES: Tuple[Tuple[str, str], ...] = (
+    ("Dilapidated Temple", "Ashina Outskirts"),
+    ("Dilapidated Temple", "Hirata Estate"),
+    ("Hirata Estate", "Hirata Estate Second Half"),
+
+    ("Dilapidated Temple", "Hirata Estate Revisited"),
+
+    ("Ashina Outskirts", "Ashina Castle Gate"),
+
+    ("Ashina Castle Gate", "Ashina Castle"),
+
+    ("Ashina Castle", "Abandoned Dungeon"),
+    ("Ashina Castle", "Ashina Reservoir"),
+    ("Ashina Castle", "Upper Sunken Valley"),
+
+    ("Senpou Temple", "Ashina Castle after Interior Ministry"),
+    ("Hirata Estate", "Ashina Castle after Interior Ministry"),
+    ("Mibu Village", "Ashina Castle after Interior Ministry"),
+    ("Sunken Valley Passage", "Ashina Castle after Interior Ministry"),
+
+    ("Ashina Castle after Interior Ministry", "Fountainhead Palace"),
+
+    ("Ashina Castle after Central Forces", "Ashina Reservoir Ending"),
+    ("Ashina Castle after Central Forces", "Ashina Outskirts after Central Forces"),
+
+    ("Upper Sunken Valley", "Sunken Valley Passage"),
+    ("Ashina Reservoir", "Abandoned Dungeon"),
+
+    ("Abandoned Dungeon", "Senpou Temple"),
+
+    ("Senpou Temple", "Senpou Temple Grounds"),
+    ("Senpou Temple Grounds", "Senpou Temple Inner Sanctum"),
+    ("Abandoned Dungeon", "Ashina Depths"),
+
+    ("Ashina Depths", "Hidden Forest"),
+
+    ("Hidden Forest", "Mibu Village"),
+
+    ("Fountainhead Palace", "Ashina Castle after Central Forces"),
+)
+"""Every (from, to) pair of regions connected by a "Go To" entrance."""
+
+assert len(set(_REGION_EDGES)) == len(_REGION_EDGES), "Duplicate region edge"
+assert all(
+    region == "Menu" or region in location_tables for edge in _REGION_EDGES for region in edge
+), "Region edge with an unknown region"
+
+
+def _is_not_advancement(item: Item) -> bool:
+    """An item rule that forbids progression items."""
+    return not item.advancement
+
+
 class SekiroWeb(WebWorld):
     setup_en = Tutorial(
         "setup",
@@ -38,13 +92,8 @@ class SekiroWorld(World):
     web = SekiroWeb()
     base_id = 100000
     required_client_version = (0, 4, 2)
-    item_name_to_id = {data.name: data.ap_code for data in item_dictionary.values() if data.ap_code is not None}
-    location_name_to_id = {
-        location.name: location.ap_code
-        for locations in location_tables.values()
-        for location in locations
-        if location.ap_code is not None
-    }
+    item_name_to_id = item_name_to_id
+    location_name_to_id = location_name_to_id
     location_name_groups = location_name_groups
     item_name_groups = item_name_groups
     location_descriptions = location_descriptions
@@ -63,11 +112,22 @@ class SekiroWorld(World):
     def __init__(self, multiworld: MultiWorld, player: int):
         super().__init__(multiworld, player)
         self.all_excluded_locations = set()
+        self._our_locations_cache: Optional[List[SekiroLocation]] = None
+        self._our_locations_by_name: Dict[str, SekiroLocation] = {}
+        self._entrances_by_region: Dict[str, Entrance] = {}
+        self._item_rules: Dict[str, CollectionRule] = {}
+        self._itempool_by_name: Dict[str, List[SekiroItem]] = defaultdict(list)
 
     def generate_early(self) -> None:
         self.created_regions = set()
         self.all_excluded_locations.update(self.options.exclude_locations.value)
 
+        self._exclude_do_not_randomize = self.options.excluded_location_behavior == "do_not_randomize"
+        self._missable_do_not_randomize = self.options.missable_location_behavior == "do_not_randomize"
+        # This only depends on the options and all_excluded_locations, so it's cached by location
+        # name. Anything that changes all_excluded_locations needs to clear the cache.
+        self._is_available_by_name = functools.lru_cache(maxsize=None)(self._compute_is_location_available)
+
 
     def create_regions(self) -> None:
         # Create Vanilla Regions
@@ -99,53 +159,23 @@ class SekiroWorld(World):
         ]})
 
         # Connect Regions
-        def create_connection(from_region: str, to_region: str):
-            connection = Entrance(self.player, f"Go To {to_region}", regions[from_region])
-            regions[from_region].exits.append(connection)
-            connection.connect(regions[to_region])
-
-        regions["Menu"].exits.append(Entrance(self.player, "New Game", regions["Menu"]))
-        self.multiworld.get_entrance("New Game", self.player).connect(regions["Dilapidated Temple"])
-
-        create_connection("Dilapidated Temple", "Ashina Outskirts")
-        create_connection("Dilapidated Temple", "Hirata Estate")
-        create_connection("Hirata Estate", "Hirata Estate Second Half")
-        
-        create_connection("Dilapidated Temple", "Hirata Estate Revisited")
-
-        create_connection("Ashina Outskirts", "Ashina Castle Gate")
-        
-        create_connection("Ashina Castle Gate", "Ashina Castle")
-        
-        create_connection("Ashina Castle", "Abandoned Dungeon")
-        create_connection("Ashina Castle", "Ashina Reservoir")
-        create_connection("Ashina Castle", "Upper Sunken Valley")
-
-        create_connection("Senpou Temple", "Ashina Castle after Interior Ministry")
-        create_connection("Hirata Estate", "Ashina Castle after Interior Ministry")
-        create_connection("Mibu Village", "Ashina Castle after Interior Ministry")
-        create_connection("Sunken Valley Passage", "Ashina Castle after Interior Ministry")
-
-        create_connection("Ashina Castle after Interior Ministry", "Fountainhead Palace")
-
-        create_connection("Ashina Castle after Central Forces", "Ashina Reservoir Ending")
-        create_connection("Ashina Castle after Central Forces", "Ashina Outskirts after Central Forces")
-
-        create_connection("Upper Sunken Valley", "Sunken Valley Passage")
-        create_connection("Ashina Reservoir", "Abandoned Dungeon")
-        
-        create_connection("Abandoned Dungeon", "Senpou Temple")
-
-        create_connection("Senpou Temple", "Senpou Temple Grounds")
-        create_connection("Senpou Temple Grounds", "Senpou Temple Inner Sanctum")
-        create_connection("Abandoned Dungeon", "Senpou Temple")
-        create_connection("Abandoned Dungeon", "Ashina Depths")
-        
-        create_connection("Ashina Depths", "Hidden Forest")
-        
-        create_connection("Hidden Forest", "Mibu Village")
-
-        create_connection("Fountainhead Palace", "Ashina Castle after Central Forces")
+        regions["Menu"].connect(regions["Dilapidated Temple"], "New Game")
+        for from_region, to_region in _REGION_EDGES:
+            connection = regions[from_region].connect(regions[to_region], f"Go To {to_region}")
+            self._entrances_by_region[to_region] = connection
+
+        # Make sure _get_our_locations() sees the finished set of locations.
+        self._our_locations_cache = None
+
+        # The parts of _fill_local_item()'s candidate filter that only depend on the location data
+        # and on availability. This runs after create_region() has finished un-excluding events.
+        self._fill_candidates_by_region: Dict[str, List[SekiroLocationData]] = {
+            region: [
+                data for data in location_table
+                if not data.missable and not data.conditional and self._is_location_available(data)
+            ]
+            for region, location_table in location_tables.items()
+        }
 
     # For each region, add the associated locations retrieved from the corresponding location_table
     def create_region(self, region_name, location_table) -> Region:
@@ -154,79 +184,93 @@ class SekiroWorld(World):
         # Use this to un-exclude event locations so the fill doesn't complain about items behind
         # them being unreachable.
         excluded = self.options.exclude_locations.value
+        unexcluded: List[str] = []
+
+        player = self.player
+        missable_forbid_useful = self.options.missable_location_behavior == "forbid_useful"
+        missable_below_excluded = (
+            self.options.missable_location_behavior < self.options.excluded_location_behavior
+        )
 
         for location in location_table:
             if self._is_location_available(location):
-                new_location = SekiroLocation(self.player, location, new_region)
+                new_location = SekiroLocation(player, location, new_region)
                 if (
                     # Exclude missable locations that don't allow useful items
-                    location.missable and self.options.missable_location_behavior == "forbid_useful"
+                    location.missable and missable_forbid_useful
                     and not (
                         # Unless they are excluded to a higher degree already
                         location.name in self.all_excluded_locations
-                        and self.options.missable_location_behavior < self.options.excluded_location_behavior
+                        and missable_below_excluded
                     )
                 ):
                     new_location.progress_type = LocationProgressType.EXCLUDED
             else:
                 # Replace non-randomized items with events that give the default item
                 event_item = (
-                    self.create_item(location.default_item_name) if location.default_item_name
-                    else SekiroItem.event(location.name, self.player)
+                    self._create_item_by_data(item_dictionary[location.default_item_name])
+                    if location.default_item_name
+                    else SekiroItem.event(location.name, player)
                 )
 
                 new_location = SekiroLocation(
-                    self.player,
+                    player,
                     location,
                     parent = new_region,
                     event = True,
                 )
                 event_item.code = None
                 new_location.place_locked_item(event_item)
-                if location.name in excluded:
-                    excluded.remove(location.name)
-                    # Only remove from all_excluded if excluded does not have priority over missable
-                    if not (self.options.missable_location_behavior < self.options.excluded_location_behavior):
-                        self.all_excluded_locations.remove(location.name)
+                if location.name in excluded: unexcluded.append(location.name)
 
             new_region.locations.append(new_location)
+            self._our_locations_by_name[location.name] = new_location
+
+        if unexcluded:
+            excluded.difference_update(unexcluded)
+            # Only remove from all_excluded if excluded does not have priority over missable
+            if not missable_below_excluded:
+                self.all_excluded_locations.difference_update(unexcluded)
+                self._is_available_by_name.cache_clear()
 
         self.multiworld.regions.append(new_region)
         self.created_regions.add(region_name)
         return new_region
 
     def create_items(self) -> None:
-        # Just used to efficiently deduplicate items
-        item_set: Set[str] = set()
-
-        # Gather all default items on randomized locations
-        self.local_itempool = []
-        num_required_extra_items = 0
+        # Count the default items on randomized locations
+        default_item_counts: Counter[str] = Counter()
         for location in cast(List[SekiroLocation], self.multiworld.get_unfilled_locations(self.player)):
-            if not self._is_location_available  (location.name):
+            if not self._is_location_available(location.name):
                 raise Exception("Sekiro generation bug: Added an unavailable location.")
+            default_item_counts[cast(str, location.data.default_item_name)] += 1
 
-            default_item_name = cast(str, location.data.default_item_name)
+        self.local_itempool = []
+        num_required_extra_items = 0
+        for default_item_name, count in default_item_counts.items():
             item = item_dictionary[default_item_name]
             if item.skip:
-                num_required_extra_items += 1
+                num_required_extra_items += count
             elif not item.unique:
-                self.local_itempool.append(self.create_item(default_item_name))
+                self.local_itempool.extend(self._create_item_by_data(item) for _ in range(count))
             else:
                 # For unique items, make sure there aren't duplicates in the item set even if there
                 # are multiple in-game locations that provide them.
-                if default_item_name in item_set:
-                    num_required_extra_items += 1
-                else:
-                    item_set.add(default_item_name)
-                    self.local_itempool.append(self.create_item(default_item_name))
+                self.local_itempool.append(self._create_item_by_data(item))
+                num_required_extra_items += count - 1
 
         injectables = self._create_injectable_items(num_required_extra_items)
         num_required_extra_items -= len(injectables)
         self.local_itempool.extend(injectables)
 
         # Extra filler items for locations containing skip items
-        self.local_itempool.extend(self.create_item(self.get_filler_item_name()) for _ in range(num_required_extra_items))
+        self.local_itempool.extend(
+            self._create_item_by_data(item_dictionary[name])
+            for name in self.random.choices(filler_item_names, k=num_required_extra_items)
+        )
+
+        for item in self.local_itempool:
+            self._itempool_by_name[item.name].append(item)
 
         # Add items to itempool
         self.multiworld.itempool += self.local_itempool
@@ -239,52 +283,44 @@ class SekiroWorld(World):
         player's starting inventory.
         """
 
-        all_injectable_items = [
-            item for item
-            in item_dictionary.values()
-            if item.inject
-        ]
-        injectable_mandatory = [
-            item for item in all_injectable_items
-            if item.classification == ItemClassification.progression
-        ]
-        injectable_optional = [
-            item for item in all_injectable_items
-            if item.classification != ItemClassification.progression
-        ]
-
-        number_to_inject = min(num_required_extra_items, len(all_injectable_items))
+        number_to_inject = min(
+            num_required_extra_items,
+            len(injectable_mandatory_items) + len(injectable_optional_items)
+        )
         items = (
             self.random.sample(
-                injectable_mandatory,
-                k=min(len(injectable_mandatory), number_to_inject)
+                injectable_mandatory_items,
+                k=min(len(injectable_mandatory_items), number_to_inject)
             )
             + self.random.sample(
-                injectable_optional,
-                k=max(0, number_to_inject - len(injectable_mandatory))
+                injectable_optional_items,
+                k=max(0, number_to_inject - len(injectable_mandatory_items))
             )
         )
 
-        if number_to_inject < len(injectable_mandatory):
+        if number_to_inject < len(injectable_mandatory_items):
             # It's worth considering the possibility of _removing_ unimportant
             # items from the pool to inject these instead rather than just
             # making them part of the starting health back
-            for item in injectable_mandatory:
-                if item in items: continue
-                self.multiworld.push_precollected(self.create_item(item))
+            chosen_names = {item.name for item in items}
+            for item in injectable_mandatory_items:
+                if item.name in chosen_names: continue
+                self.multiworld.push_precollected(self._create_item_by_data(item))
                 warning(
                     f"Couldn't add \"{item.name}\" to the item pool for " + 
                     f"{self.player_name}. Adding it to the starting " +
                     f"inventory instead."
                 )
 
-        return [self.create_item(item) for item in items]
+        return [self._create_item_by_data(item) for item in items]
 
     def create_item(self, item: Union[str, SekiroItemData]) -> SekiroItem:
         data = item if isinstance(item, SekiroItemData) else item_dictionary[item]
-        classification = None
+        return self._create_item_by_data(data)
 
-        return SekiroItem(self.player, data, classification=classification)
+    def _create_item_by_data(self, data: SekiroItemData) -> SekiroItem:
+        """Like create_item(), for callers that already have the item's data."""
+        return SekiroItem(self.player, data, classification=None)
 
     def _fill_local_item(
         self, name: str,
@@ -298,18 +334,18 @@ class SekiroWorld(World):
 
         If the item could not be placed, it will be added to starting inventory.
         """
-        item = next((item for item in self.local_itempool if item.name == name), None)
-        if not item: return
+        items = self._itempool_by_name.get(name)
+        if not items: return
+        item = items.pop(0)
+
+        locations_by_name = self._our_locations_by_name
 
         candidate_locations = [
             location for location in (
-                self.multiworld.get_location(location.name, self.player)
+                locations_by_name[location.name]
                 for region in regions
-                for location in location_tables[region]
-                if self._is_location_available(location)
-                and not location.missable
-                and not location.conditional
-                and (not additional_condition or additional_condition(location))
+                for location in self._fill_candidates_by_region[region]
+                if not additional_condition or additional_condition(location)
             )
             # We can't use location.progress_type here because it's not set
             # until after `set_rules()` runs.
@@ -401,40 +437,37 @@ class SekiroWorld(World):
         manually add item rules to exclude important items.
         """
 
-        all_locations = self._get_our_locations()
+        excluded_allow_useful = self.options.excluded_location_behavior == "allow_useful"
+        missable_allow_useful = self.options.missable_location_behavior == "allow_useful"
+        # With neither option set there are no locations to relax and no option values to adjust.
+        if not excluded_allow_useful and not missable_allow_useful: return
 
-        allow_useful_locations = (
-            (
-                {
-                    location.name
-                    for location in all_locations
-                    if location.name in self.all_excluded_locations
-                    and not location.data.missable
-                }
-                if self.options.excluded_location_behavior < self.options.missable_location_behavior
-                else self.all_excluded_locations
-            )
-            if self.options.excluded_location_behavior == "allow_useful"
-            else set()
-        ).union(
-            {
-                location.name
-                for location in all_locations
-                if location.data.missable
-                and not (
-                    location.name in self.all_excluded_locations
-                    and self.options.missable_location_behavior <
-                        self.options.excluded_location_behavior
-                )
-            }
-            if self.options.missable_location_behavior == "allow_useful"
-            else set()
+        all_locations = self._get_our_locations()
+        excluded_names = self.all_excluded_locations
+        # Whether the excluded behavior takes priority for locations that are both excluded and
+        # missable, or vice versa.
+        excluded_below_missable = (
+            self.options.excluded_location_behavior < self.options.missable_location_behavior
+        )
+        missable_below_excluded = (
+            self.options.missable_location_behavior < self.options.excluded_location_behavior
         )
+
+        allow_useful_locations: Set[str] = set()
+        for location in all_locations:
+            excluded = location.name in excluded_names
+            missable = location.data.missable
+            if (
+                excluded_allow_useful and excluded
+                and not (excluded_below_missable and missable)
+            ) or (
+                missable_allow_useful and missable
+                and not (excluded and missable_below_excluded)
+            ):
+                allow_useful_locations.add(location.name)
+
         for location in allow_useful_locations:
-            self._add_item_rule(
-                location,
-                lambda item: not item.advancement
-            )
+            self._add_item_rule(location, _is_not_advancement)
 
         # Prevent the player from prioritizing and "excluding" the same location
         self.options.priority_locations.value -= allow_useful_locations
@@ -447,14 +480,14 @@ class SekiroWorld(World):
 
         The rule can just be a single item/event name as well as an explicit rule lambda.
         """
+        if isinstance(rule, str):
+            assert item_dictionary[rule].classification == ItemClassification.progression
+            rule = self._has_item_rule(rule)
+
         locations = location if isinstance(location, list) else [location]
         for location in locations:
-
             if not self._is_location_available(location): continue
-            if isinstance(rule, str):
-                assert item_dictionary[rule].classification == ItemClassification.progression
-                rule = lambda state, item=rule: state.has(item, self.player)
-            add_rule(self.multiworld.get_location(location, self.player), rule)
+            add_rule(self._our_locations_by_name[location], rule)
 
     def _add_entrance_rule(self, region: str, rule: Union[CollectionRule, str]) -> None:
         """Sets a rule for the entrance to the given region."""
@@ -463,13 +496,24 @@ class SekiroWorld(World):
         if isinstance(rule, str):
             if " -> " not in rule:
                 assert item_dictionary[rule].classification == ItemClassification.progression
-            rule = lambda state, item=rule: state.has(item, self.player)
-        add_rule(self.multiworld.get_entrance("Go To " + region, self.player), rule)
+            rule = self._has_item_rule(rule)
+        add_rule(self._entrances_by_region[region], rule)
+
+    def _has_item_rule(self, item: str) -> CollectionRule:
+        """Returns a rule that requires the given item.
+
+        Rules are cached by item name so that every location and entrance gated on the same item
+        shares a single closure.
+        """
+        rule = self._item_rules.get(item)
+        if rule is None:
+            rule = self._item_rules[item] = lambda state: state.has(item, self.player)
+        return rule
 
     def _add_item_rule(self, location: str, rule: ItemRule) -> None:
         """Sets a rule for what items are allowed in a given location."""
         if not self._is_location_available(location): return
-        add_item_rule(self.multiworld.get_location(location, self.player), rule)
+        add_item_rule(self._our_locations_by_name[location], rule)
 
     def _can_go_to(self, state, region) -> bool:
         """Returns whether state can access the given region name."""
@@ -477,30 +521,24 @@ class SekiroWorld(World):
 
     def _can_get(self, state, location) -> bool:
         """Returns whether state can access the given location name."""
-        return state.can_reach_location(location, self.player)
+        # Region reachability is already cached on the state, so the only thing worth skipping here
+        # is the multiworld lookup by name.
+        return self._our_locations_by_name[location].can_reach(state)
 
     def _is_location_available(
         self,
         location: Union[str, SekiroLocationData, SekiroLocation]
     ) -> bool:
         """Returns whether the given location is being randomized."""
-        if isinstance(location, SekiroLocationData):
-            data = location
-        elif isinstance(location, SekiroLocation):
-            data = location.data
-        else:
-            data = location_dictionary[location]
+        return self._is_available_by_name(location if isinstance(location, str) else location.name)
 
+    def _compute_is_location_available(self, name: str) -> bool:
+        """The uncached implementation of _is_location_available()."""
+        data = location_dictionary[name]
         return (
             not data.is_event
-            and not (
-                self.options.excluded_location_behavior == "do_not_randomize"
-                and data.name in self.all_excluded_locations
-            )
-            and not (
-                self.options.missable_location_behavior == "do_not_randomize"
-                and data.missable
-            )
+            and not (self._exclude_do_not_randomize and name in self.all_excluded_locations)
+            and not (self._missable_do_not_randomize and data.missable)
         )
 
     def write_spoiler(self, spoiler_handle: TextIO) -> None:
@@ -533,7 +571,14 @@ class SekiroWorld(World):
         return items.pop(0)
 
     def _get_our_locations(self) -> List[SekiroLocation]:
-        return cast(List[SekiroLocation], self.multiworld.get_locations(self.player))
+        """Returns all of this world's locations.
+
+        The result is cached, so this shouldn't be called until `create_regions()` is done adding
+        locations.
+        """
+        if self._our_locations_cache is None:
+            self._our_locations_cache = list(cast(List[SekiroLocation], self.multiworld.get_locations(self.player)))
+        return self._our_locations_cache
 
     def fill_slot_data(self) -> Dict[str, object]:
         slot_data: Dict[str, object] = {}
@@ -544,15 +589,16 @@ class SekiroWorld(World):
         # We include all the items the game knows about so that users can manually request items
         # that aren't randomized, and then we _also_ include all the items that are placed in
         # practice `item_dictionary.values()` doesn't include upgraded or infused weapons.
-        items_by_name = {
+        player = self.player
+        multiworld = self.multiworld
+        options = self.options
+        items_by_name = {item.name: item for item in item_dictionary.values()}
+        items_by_name.update({
             location.item.name: cast(SekiroItem, location.item).data
-            for location in self.multiworld.get_filled_locations()
+            for location in multiworld.get_filled_locations()
             # item.code None is used for events, which we want to skip
-            if location.item.code is not None and location.item.player == self.player
-        }
-        for item in item_dictionary.values():
-            if item.name not in items_by_name:
-                items_by_name[item.name] = item
+            if location.item.code is not None and location.item.player == player
+        })
 
         ap_ids_to_sekiro_ids: Dict[str, int] = {}
         item_counts: Dict[str, int] = {}
@@ -564,7 +610,7 @@ class SekiroWorld(World):
         # A map from Archipelago's location IDs to the keys the static randomizer uses to identify
         # locations.
         location_ids_to_keys: Dict[int, str] = {}
-        for location in cast(List[SekiroLocation], self.multiworld.get_filled_locations(self.player)):
+        for location in cast(List[SekiroLocation], multiworld.get_filled_locations(player)):
             # Skip events and only look at this world's locations
             if (location.address is not None and location.item.code is not None
                     and location.data.static):
@@ -572,15 +618,15 @@ class SekiroWorld(World):
 
         slot_data = {
             "options": {
-                "death_link": self.options.death_link.value,
-                "randomize_enemies": self.options.randomize_enemies.value,
-                "reduce_harmless_enemies": self.options.reduce_harmless_enemies.value,
-                "scale_enemies": self.options.scale_enemies.value,
+                "death_link": options.death_link.value,
+                "randomize_enemies": options.randomize_enemies.value,
+                "reduce_harmless_enemies": options.reduce_harmless_enemies.value,
+                "scale_enemies": options.scale_enemies.value,
             },
-            "seed": self.multiworld.seed_name,  # to verify the server's multiworld
-            "slot": self.multiworld.player_name[self.player],  # to connect to server
+            "seed": multiworld.seed_name,  # to verify the server's multiworld
+            "slot": multiworld.player_name[player],  # to connect to server
             # Reserializing here is silly, but it's easier for the static randomizer.
-            "random_enemy_preset": json.dumps(self.options.random_enemy_preset.value),
+            "random_enemy_preset": json.dumps(options.random_enemy_preset.value),
             "apIdsToItemIds": ap_ids_to_sekiro_ids,
             "itemCounts": item_counts,
             "locationIdsToKeys": location_ids_to_keys,